@@ -6,6 +6,7 @@ This demonstrates the SQL generation using Claude.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path
@@ -44,12 +45,16 @@ def main():
     print("=" * 60)
     print()
     
-    for i, query in enumerate(test_queries, 1):
+    # PERFORMANCE: Each generate_sql call is an HTTPS round-trip to Anthropic,
+    # so run them concurrently — total wall time is ~one round-trip instead of
+    # five. ex.map preserves the query order for printing.
+    with ThreadPoolExecutor(max_workers=len(test_queries)) as ex:
+        results = list(ex.map(generate_sql, test_queries))
+
+    for i, (query, result) in enumerate(zip(test_queries, results), 1):
         print(f"{i}. Question: {query}")
         print("-" * 60)
-        
-        result = generate_sql(query)
-        
+
         if result['success']:
             print(f"Generated SQL:")
             print(f"  {result['sql']}")
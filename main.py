@@ -19,23 +19,39 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import Config, config
-from src.agent.orchestrator import VoiceToSQLAgent, run_interactive_session
+from config import config
 
+# PERFORMANCE: The orchestrator transitively imports whisper/torch/anthropic/
+# sounddevice — multi-second, hundreds of MB. Import it inside the functions
+# that need it so lightweight paths like --config and --help stay fast.
 
-def print_banner():
-    """Print the application banner."""
-    banner = """
+# Static display strings, built once at module load
+_BANNER = """
 ╔═══════════════════════════════════════════════════════════╗
 ║                   VOICE-TO-SQL AGENT                      ║
 ║        Convert natural language to SQL queries            ║
 ╚═══════════════════════════════════════════════════════════╝
     """
-    print(banner)
+
+_HELP_TEXT = """
+Enter natural language questions about the database.
+Examples:
+  - How many products do we have?
+  - Show me orders from last month
+  - What customers have the highest order totals?
+  - Which products are low on stock?
+"""
+
+
+def print_banner():
+    """Print the application banner."""
+    print(_BANNER)
 
 
 def run_text_query(query: str):
     """Run a single text query."""
+    from src.agent.orchestrator import VoiceToSQLAgent
+
     agent = VoiceToSQLAgent(verbose=True)
     result = agent.process_text(query)
     
@@ -51,7 +67,9 @@ def run_audio_file(file_path: str):
     if not Path(file_path).exists():
         print(f"Error: File not found: {file_path}")
         return 1
-    
+
+    from src.agent.orchestrator import VoiceToSQLAgent
+
     agent = VoiceToSQLAgent(verbose=True)
     result = agent.process_audio_file(file_path)
     
@@ -114,6 +132,8 @@ def run_tests():
         print("   ⚠️  Skipping (ANTHROPIC_API_KEY not set)")
     else:
         try:
+            from src.agent.orchestrator import VoiceToSQLAgent
+
             agent = VoiceToSQLAgent(verbose=False)
             result = agent.process_text("What are the top 3 products by price?")
             if result.success:
@@ -199,16 +219,17 @@ Examples:
     
     # Show config
     if args.config:
-        Config.print_config()
+        config.print_config()
         return 0
     
     # Run tests
     if args.test:
         return run_tests()
     
-    # Validate configuration
-    errors = Config.validate()
-    if errors and not args.test:
+    # Validate configuration (cached after the first run, so the --config
+    # path's print_config() and this call share one validation pass)
+    errors = config.validate()
+    if errors:
         print("Configuration errors:")
         for error in errors:
             print(f"  - {error}")
@@ -231,6 +252,8 @@ Examples:
     
     # Interactive voice mode (default)
     try:
+        from src.agent.orchestrator import run_interactive_session
+
         run_interactive_session()
         return 0
     except KeyboardInterrupt:
@@ -242,7 +265,9 @@ def run_text_interactive():
     """Run interactive text-only mode."""
     print("Text-only mode (type your queries)\n")
     print("Commands: 'quit' to exit, 'help' for help\n")
-    
+
+    from src.agent.orchestrator import VoiceToSQLAgent
+
     agent = VoiceToSQLAgent(verbose=False)
     
     while True:
@@ -257,12 +282,7 @@ def run_text_interactive():
                 break
             
             if query.lower() == 'help':
-                print("\nEnter natural language questions about the database.")
-                print("Examples:")
-                print("  - How many products do we have?")
-                print("  - Show me orders from last month")
-                print("  - What customers have the highest order totals?")
-                print("  - Which products are low on stock?\n")
+                print(_HELP_TEXT)
                 continue
             
             result = agent.process_text(query)
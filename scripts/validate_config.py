@@ -0,0 +1,40 @@
+"""
+Standalone configuration validation check.
+
+Runs Config.validate() outside the application so configuration errors are
+caught at commit/CI time instead of at import time in every process.
+
+Run with: python scripts/validate_config.py
+Exits non-zero if any CRITICAL errors are found.
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import config
+
+
+def main():
+    errors = config.validate()
+
+    if not errors:
+        print("✅ Configuration OK")
+        return 0
+
+    print("⚠️  CONFIGURATION WARNINGS/ERRORS:")
+    for error in errors:
+        print(f"  • {error}")
+
+    critical_errors = [e for e in errors if e.startswith("CRITICAL")]
+    if critical_errors:
+        print("\nPlease fix these issues before running the application.")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
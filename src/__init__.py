@@ -1 +1,11 @@
 # Voice-to-SQL Agent
+#
+# PERFORMANCE: The repo root goes onto sys.path once, here, when the src
+# package is first imported — instead of every module repeating its own
+# abspath/dirname preamble and an O(n) sys.path scan
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
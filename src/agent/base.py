@@ -0,0 +1,95 @@
+"""
+Shared base class for Claude-backed agents.
+
+Centralizes the API-key lookup and client construction that every
+specialist agent (and the router) used to repeat.
+
+PERFORMANCE: All agents share one Anthropic client per flavor — and thus
+one httpx connection pool — so agent-to-agent collaboration hops reuse a
+warm keep-alive connection instead of each agent paying its own TLS
+handshake.
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, ClassVar, Optional
+
+
+class BaseClaudeAgent:
+    """Base for agents that talk to Claude via the Anthropic SDK"""
+
+    DEFAULT_MODEL = "claude-sonnet-4-20250514"
+
+    _SHARED_CLIENT: ClassVar[Optional[Any]] = None
+    # Async clients are scoped per event loop (see get_async_client); the
+    # weak keys let a client die with the loop that owns its connections
+    _ASYNC_CLIENTS: ClassVar["weakref.WeakKeyDictionary"] = weakref.WeakKeyDictionary()
+    _CLIENT_LOCK: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, api_key: Optional[str] = None, client: Optional[Any] = None):
+        self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        if not self.api_key:
+            raise ValueError("ANTHROPIC_API_KEY is required")
+
+        # An explicitly injected client wins; otherwise everyone shares one
+        self.client = client if client is not None else self.get_client(self.api_key)
+        self.model = self.DEFAULT_MODEL
+
+    @property
+    def async_client(self):
+        """The event-loop-scoped async client (resolve inside async code)"""
+        return self.get_async_client(self.api_key)
+
+    @staticmethod
+    def _make_http_client(use_async: bool):
+        """httpx client with a keep-alive pool, HTTP/2 when installed
+
+        PERFORMANCE: HTTP/2 multiplexes concurrent parallel-collaboration
+        requests over one or two TCP connections; the explicit limits keep
+        the pool warm without hoarding sockets
+        """
+        import httpx
+        limits = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+        client_cls = httpx.AsyncClient if use_async else httpx.Client
+        try:
+            return client_cls(http2=True, limits=limits)
+        except ImportError:
+            # The h2 extra isn't installed — HTTP/1.1 keep-alive still pools
+            return client_cls(limits=limits)
+
+    @classmethod
+    def get_client(cls, api_key: str):
+        """The shared sync client, created once under a lock"""
+        if BaseClaudeAgent._SHARED_CLIENT is None:
+            with BaseClaudeAgent._CLIENT_LOCK:
+                if BaseClaudeAgent._SHARED_CLIENT is None:
+                    import anthropic
+                    BaseClaudeAgent._SHARED_CLIENT = anthropic.Anthropic(
+                        api_key=api_key,
+                        http_client=cls._make_http_client(use_async=False)
+                    )
+        return BaseClaudeAgent._SHARED_CLIENT
+
+    @classmethod
+    def get_async_client(cls, api_key: str):
+        """An async client scoped to the running event loop
+
+        httpx keep-alive connections (and their anyio locks) are bound to
+        the loop that created them, and callers like process_query's
+        parallel branch spin up a fresh loop per asyncio.run. Sharing one
+        client across those loops yields "Event loop is closed" failures on
+        the second query, so each loop gets its own client and pool, and
+        both are garbage-collected with the loop.
+        """
+        loop = asyncio.get_running_loop()
+        client = BaseClaudeAgent._ASYNC_CLIENTS.get(loop)
+        if client is None:
+            import anthropic
+            client = anthropic.AsyncAnthropic(
+                api_key=api_key,
+                http_client=cls._make_http_client(use_async=True)
+            )
+            BaseClaudeAgent._ASYNC_CLIENTS[loop] = client
+        return client
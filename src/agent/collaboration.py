@@ -6,109 +6,271 @@ Agents can share insights, build on each other's responses, and
 collectively arrive at comprehensive solutions.
 """
 
+import asyncio
+import json
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+import uuid
+
+from functools import lru_cache, partial
 from typing import Dict, Any, List, Optional
+from collections import OrderedDict, deque, namedtuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+# PERFORMANCE: orjson serializes dataclass-shaped dicts 3-10x faster than
+# stdlib json; fall back to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# PERFORMANCE: Memoize knowledge retrieval keyed by (retriever, agent type,
+# query) — dispatching one query to N agents repeats identical retrieval
+# work, and popular queries recur across sessions
+@lru_cache(maxsize=512)
+def _retrieve_cached(knowledge_retriever: Any, agent_type: str, query: str) -> str:
+    return knowledge_retriever.get_context_for_query(
+        agent_type=agent_type,
+        query=query
+    )
+
+# PERFORMANCE: Cap on concurrent agent calls so parallel collaboration
+# doesn't trip Anthropic rate limits
+MAX_PARALLEL_AGENTS = 5
+
+# Precomputed agent capabilities — avoids hasattr (a getattr + exception
+# catch) on every loop iteration for properties that never change at runtime
+_AgentAdapter = namedtuple('_AgentAdapter', ('name', 'process', 'process_async'))
+
 
 @dataclass
 class AgentMessage:
     """Represents a message from an agent in a collaboration"""
     agent_name: str
     content: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    # PERFORMANCE: A float epoch timestamp is ~10x cheaper to obtain and
+    # allocate than a datetime; a datetime is only materialized on demand
+    timestamp: float = field(default_factory=time.time)
     message_type: str = "response"  # response, question, suggestion, handoff
     metadata: Dict[str, Any] = field(default_factory=dict)
-    
+
+    @property
+    def timestamp_dt(self) -> datetime:
+        """The timestamp as a datetime, built lazily when needed"""
+        return datetime.fromtimestamp(self.timestamp)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
         return {
             "agent": self.agent_name,
             "content": self.content,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_dt.isoformat(),
             "type": self.message_type,
             "metadata": self.metadata
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes for HTTP responses / log lines"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode("utf-8")
 
-@dataclass
+
+# Bound on retained messages so very long sessions can't grow unboundedly
+MAX_HISTORY = 1000
+
+# Bounds for the manager's session store
+MAX_ACTIVE_SESSIONS = 1000
+SESSION_TTL_SECONDS = 3600
+
+
+# PERFORMANCE: slots halve per-instance memory (no __dict__) and make
+# attribute access a fixed-offset load on these per-query allocations
+@dataclass(slots=True)
 class CollaborationSession:
-    """Manages a multi-agent collaboration session"""
+    """Manages a multi-agent collaboration session
+
+    PERFORMANCE: Messages are stored struct-of-arrays — parallel bounded
+    deques per field — because the synthesis/context hot paths only touch
+    agent names, contents and types. AgentMessage remains the transient view
+    object for the public API.
+    """
     query: str
     primary_agent: str
     supporting_agents: List[str]
     mode: str  # single, sequential, parallel
-    messages: List[AgentMessage] = field(default_factory=list)
     status: str = "active"  # active, completed, failed
     final_response: Optional[str] = None
-    
+    # SoA message columns, appended together in add_message
+    _agent_names: deque = field(default_factory=lambda: deque(maxlen=MAX_HISTORY), init=False, repr=False)
+    _contents: deque = field(default_factory=lambda: deque(maxlen=MAX_HISTORY), init=False, repr=False)
+    _message_types: deque = field(default_factory=lambda: deque(maxlen=MAX_HISTORY), init=False, repr=False)
+    _timestamps: deque = field(default_factory=lambda: deque(maxlen=MAX_HISTORY), init=False, repr=False)
+    _metadatas: deque = field(default_factory=lambda: deque(maxlen=MAX_HISTORY), init=False, repr=False)
+    # PERFORMANCE: Rows are immutable once added, so serialized dicts are
+    # computed once per row and reused (None until first requested)
+    _dict_caches: deque = field(default_factory=lambda: deque(maxlen=MAX_HISTORY), init=False, repr=False)
+    # PERFORMANCE: Context dicts are precomputed incrementally in add_message
+    # so get_context_for_agent never rebuilds O(N) dicts per call
+    _context_cache: deque = field(default_factory=lambda: deque(maxlen=MAX_HISTORY), init=False, repr=False)
+    _agents_seen: set = field(default_factory=set, init=False, repr=False)
+    # PERFORMANCE: Synthesis result, cached until the next message arrives
+    _synthesized: Optional[str] = field(default=None, init=False, repr=False)
+    # Sticky flag: once the retriever fails for this session, later agents
+    # skip it instead of each paying a full (possibly timing-out) call
+    _retriever_failed: bool = field(default=False, init=False, repr=False)
+    # PERFORMANCE: Last response per canonical agent key ("sql", "csharp",
+    # "epicor", ...) so result building is a dict lookup, not a scan over
+    # the transcript with per-message substring matching
+    responses: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def messages(self) -> List[AgentMessage]:
+        """Transient AgentMessage views over the column storage"""
+        return [
+            AgentMessage(agent_name=name, content=content,
+                         timestamp=ts, message_type=mtype, metadata=meta)
+            for name, content, ts, mtype, meta in zip(
+                self._agent_names, self._contents, self._timestamps,
+                self._message_types, self._metadatas)
+        ]
+
     def add_message(self, message: AgentMessage):
         """Add a message to the collaboration"""
-        self.messages.append(message)
-    
+        self._agent_names.append(message.agent_name)
+        self._contents.append(message.content)
+        self._message_types.append(message.message_type)
+        self._timestamps.append(message.timestamp)
+        self._metadatas.append(message.metadata)
+        self._dict_caches.append(None)
+        self._context_cache.append({
+            "agent": message.agent_name,
+            "response": message.content,
+            "type": message.message_type
+        })
+        self._agents_seen.add(message.agent_name)
+        self._synthesized = None
+
     def get_context_for_agent(self, agent_name: str) -> List[Dict[str, str]]:
         """
         Get relevant context for an agent to review before responding
-        
+
         Returns messages from other agents that this agent should consider
         """
-        context = []
-        for msg in self.messages:
-            if msg.agent_name != agent_name:
-                context.append({
-                    "agent": msg.agent_name,
-                    "response": msg.content,
-                    "type": msg.message_type
-                })
-        return context
-    
+        # Common case: distinct specialists, nothing to filter out
+        if agent_name not in self._agents_seen:
+            return list(self._context_cache)
+        return [ctx for ctx in self._context_cache if ctx["agent"] != agent_name]
+
+    def _message_dict(self, index: int) -> Dict[str, Any]:
+        """Serialized form of one message row, cached per row"""
+        cached = self._dict_caches[index]
+        if cached is None:
+            cached = {
+                "agent": self._agent_names[index],
+                "content": self._contents[index],
+                "timestamp": datetime.fromtimestamp(self._timestamps[index]).isoformat(),
+                "type": self._message_types[index],
+                "metadata": self._metadatas[index]
+            }
+            self._dict_caches[index] = cached
+        return cached
+
     def get_all_responses(self) -> List[Dict[str, Any]]:
         """Get all agent responses in order"""
-        return [msg.to_dict() for msg in self.messages]
-    
+        return [self._message_dict(i) for i in range(len(self._contents))]
+
     def synthesize_responses(self) -> str:
         """
         Combine all agent responses into a coherent final response
+
+        PERFORMANCE: The multi-KB result is cached until a new message
+        invalidates it, so execute_* completion and later to_dict calls
+        share one synthesis pass
         """
-        if not self.messages:
+        if self._synthesized is not None:
+            return self._synthesized
+
+        if not self._contents:
             return "No responses available."
-        
-        if len(self.messages) == 1:
-            return self.messages[0].content
-        
+
+        if len(self._contents) == 1:
+            return self._contents[0]
+
         # Build a structured response showing each agent's contribution
-        synthesis = f"**Multi-Agent Collaboration Response**\n\n"
-        synthesis += f"Query: {self.query}\n\n"
-        synthesis += "---\n\n"
-        
-        for i, msg in enumerate(self.messages, 1):
-            synthesis += f"### {msg.agent_name}\n\n"
-            synthesis += f"{msg.content}\n\n"
-            if i < len(self.messages):
-                synthesis += "---\n\n"
-        
-        return synthesis
-    
+        # PERFORMANCE: Accumulate parts and join once — repeated str += on
+        # multi-KB responses goes quadratic in CPython
+        parts = [
+            "**Multi-Agent Collaboration Response**\n\n",
+            f"Query: {self.query}\n\n",
+            "---\n\n",
+        ]
+
+        total = len(self._contents)
+        for i, (name, content) in enumerate(zip(self._agent_names, self._contents), 1):
+            parts.append(f"### {name}\n\n")
+            parts.append(f"{content}\n\n")
+            if i < total:
+                parts.append("---\n\n")
+
+        self._synthesized = "".join(parts)
+        return self._synthesized
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert session to dictionary"""
+        # PERFORMANCE: Reuse the completed session's final_response rather
+        # than re-synthesizing the multi-KB string per serialization
+        final = self.final_response if self.final_response else self.synthesize_responses()
         return {
             "query": self.query,
             "primary_agent": self.primary_agent,
             "supporting_agents": self.supporting_agents,
             "mode": self.mode,
-            "messages": [msg.to_dict() for msg in self.messages],
+            "messages": self.get_all_responses(),
             "status": self.status,
-            "final_response": self.final_response or self.synthesize_responses()
+            "final_response": final
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes for HTTP responses / log lines
+
+        PERFORMANCE: Callers that immediately json.dumps the to_dict output
+        walk the structure twice; this path hands the cached dicts to orjson
+        once and returns wire-ready bytes
+        """
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode("utf-8")
+
 
 class CollaborationManager:
     """Manages agent collaboration workflows"""
     
     def __init__(self):
         """Initialize the collaboration manager"""
-        self.active_sessions: Dict[str, CollaborationSession] = {}
-    
+        # PERFORMANCE: Bounded, TTL-evicted store — each session holds full
+        # multi-KB LLM responses, so an unbounded dict is a monotonic memory
+        # leak in a long-running server. Insertion order == creation order,
+        # so expired entries are always at the front.
+        self.active_sessions: "OrderedDict[str, CollaborationSession]" = OrderedDict()
+        self._session_created_at: Dict[str, float] = {}
+        # PERFORMANCE: Agent capability adapters, cached on first encounter
+        self._agent_cache: Dict[int, _AgentAdapter] = {}
+
+    def _evict_sessions(self, now: float):
+        """Drop expired sessions, then enforce the size bound (oldest first)"""
+        cutoff = now - SESSION_TTL_SECONDS
+        while self.active_sessions:
+            oldest_id = next(iter(self.active_sessions))
+            if (self._session_created_at[oldest_id] >= cutoff
+                    and len(self.active_sessions) <= MAX_ACTIVE_SESSIONS):
+                break
+            del self.active_sessions[oldest_id]
+            del self._session_created_at[oldest_id]
+
     def create_session(
         self,
         query: str,
@@ -123,13 +285,53 @@ class CollaborationManager:
             supporting_agents=supporting_agents,
             mode=mode
         )
-        
-        # Store session with timestamp-based ID
-        session_id = f"{datetime.now().timestamp()}"
+
+        # uuid keys: float timestamps can collide under concurrency
+        session_id = uuid.uuid4().hex
+        now = time.time()
         self.active_sessions[session_id] = session
-        
+        self._session_created_at[session_id] = now
+        self._evict_sessions(now)
+
         return session
     
+    def _adapter(self, agent_key: str, agent: Any) -> _AgentAdapter:
+        """Capability adapter for an agent, cached after the first lookup"""
+        adapter = self._agent_cache.get(id(agent))
+        if adapter is None:
+            adapter = _AgentAdapter(
+                name=getattr(agent, 'agent_name', None) or agent_key.upper(),
+                process=getattr(agent, 'process', None),
+                process_async=getattr(agent, 'process_async', None)
+            )
+            self._agent_cache[id(agent)] = adapter
+        return adapter
+
+    def _get_knowledge_context(
+        self,
+        session: CollaborationSession,
+        knowledge_retriever: Any,
+        agent_key: str
+    ) -> str:
+        """Fetch knowledge context for an agent, tolerating retriever failures
+
+        FIXED: Correct method name and parameter order — the KnowledgeBase
+        class has get_context_for_query(agent_type, query), not
+        retrieve(query, agent_type)
+        """
+        if not knowledge_retriever or session._retriever_failed:
+            return ""
+        try:
+            return _retrieve_cached(knowledge_retriever, agent_key, session.query)
+        except (OSError, ValueError, LookupError, RuntimeError) as e:
+            # Targeted exceptions only — a bare except here used to swallow
+            # KeyboardInterrupt/SystemExit. Log once and mark the session so
+            # the remaining agents don't repeat a failing (or timing-out)
+            # retrieval round-trip.
+            print(f"Warning: Failed to retrieve knowledge context for {agent_key}: {e}")
+            session._retriever_failed = True
+            return ""
+
     def execute_sequential_collaboration(
         self,
         session: CollaborationSession,
@@ -145,38 +347,44 @@ class CollaborationManager:
         3. Final synthesis combines all insights
         """
         # Determine agent order: primary first, then supporting
-        agent_order = [session.primary_agent] + session.supporting_agents
-        
-        for agent_key in agent_order:
-            if agent_key not in agents:
-                continue
-            
-            agent = agents[agent_key]
-            agent_name = agent.agent_name if hasattr(agent, 'agent_name') else agent_key.upper()
-            
-            # Get knowledge context if available
-            # FIXED: Correct method name and parameter order
-            # The KnowledgeBase class has get_context_for_query(agent_type, query)
-            # not retrieve(query, agent_type)
-            knowledge_context = ""
-            if knowledge_retriever:
-                try:
-                    knowledge_context = knowledge_retriever.get_context_for_query(
-                        agent_type=agent_key,
-                        query=session.query
-                    )
-                except Exception as e:
-                    # Log the error for debugging (was silently failing before)
-                    print(f"Warning: Failed to retrieve knowledge context for {agent_key}: {e}")
-                    pass
+        agent_order = [
+            agent_key for agent_key in [session.primary_agent] + session.supporting_agents
+            if agent_key in agents
+        ]
+        if not agent_order:
+            session.status = "completed"
+            session.final_response = session.synthesize_responses()
+            return session
+
+        # PERFORMANCE: Knowledge retrieval and LLM inference are independent
+        # I/O waits, so agent K+1's retrieval runs on a worker thread while
+        # agent K's LLM call is still in flight — the retriever latency is
+        # hidden behind inference for every agent after the first
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        next_context = prefetcher.submit(
+            self._get_knowledge_context, session, knowledge_retriever, agent_order[0]
+        )
+
+        for i, agent_key in enumerate(agent_order):
+            adapter = self._adapter(agent_key, agents[agent_key])
+            agent_name = adapter.name
+
+            # Join this agent's (prefetched) knowledge context and kick off
+            # the next agent's retrieval before calling the LLM
+            knowledge_context = next_context.result()
+            if i + 1 < len(agent_order):
+                next_context = prefetcher.submit(
+                    self._get_knowledge_context, session, knowledge_retriever,
+                    agent_order[i + 1]
+                )
             
             # Get collaboration context (previous agent responses)
             collaboration_context = session.get_context_for_agent(agent_name)
             
             try:
                 # Agent processes with context from previous agents
-                if hasattr(agent, 'process'):
-                    result = agent.process(
+                if adapter.process:
+                    result = adapter.process(
                         session.query,
                         knowledge_context=knowledge_context,
                         collaboration_context=collaboration_context if collaboration_context else None
@@ -194,6 +402,7 @@ class CollaborationManager:
                         }
                     )
                     session.add_message(message)
+                    session.responses[agent_key] = message.content
                     
             except Exception as e:
                 # Log error but continue with other agents
@@ -204,7 +413,8 @@ class CollaborationManager:
                     metadata={"error": str(e)}
                 )
                 session.add_message(error_message)
-        
+
+        prefetcher.shutdown(wait=False)
         session.status = "completed"
         session.final_response = session.synthesize_responses()
         
@@ -229,29 +439,18 @@ class CollaborationManager:
             if agent_key not in agents:
                 continue
             
-            agent = agents[agent_key]
-            agent_name = agent.agent_name if hasattr(agent, 'agent_name') else agent_key.upper()
+            adapter = self._adapter(agent_key, agents[agent_key])
+            agent_name = adapter.name
             
-            # Get knowledge context if available
-            # FIXED: Correct method name and parameter order
-            # The KnowledgeBase class has get_context_for_query(agent_type, query)
-            # not retrieve(query, agent_type)
-            knowledge_context = ""
-            if knowledge_retriever:
-                try:
-                    knowledge_context = knowledge_retriever.get_context_for_query(
-                        agent_type=agent_key,
-                        query=session.query
-                    )
-                except Exception as e:
-                    # Log the error for debugging (was silently failing before)
-                    print(f"Warning: Failed to retrieve knowledge context for {agent_key}: {e}")
-                    pass
+            # Get knowledge context if available (cached per query/agent)
+            knowledge_context = self._get_knowledge_context(
+                session, knowledge_retriever, agent_key
+            )
             
             try:
                 # Agent processes without collaboration context (parallel mode)
-                if hasattr(agent, 'process'):
-                    result = agent.process(
+                if adapter.process:
+                    result = adapter.process(
                         session.query,
                         knowledge_context=knowledge_context,
                         collaboration_context=None  # No context in parallel mode
@@ -267,6 +466,7 @@ class CollaborationManager:
                         }
                     )
                     session.add_message(message)
+                    session.responses[agent_key] = message.content
                     
             except Exception as e:
                 error_message = AgentMessage(
@@ -282,6 +482,95 @@ class CollaborationManager:
         
         return session
     
+    async def execute_parallel_collaboration_async(
+        self,
+        session: CollaborationSession,
+        agents: Dict[str, Any],
+        knowledge_retriever: Any = None,
+        executor: Any = None
+    ) -> CollaborationSession:
+        """
+        Execute parallel collaboration with truly concurrent agent calls
+
+        PERFORMANCE: Each agent.process is an Anthropic HTTP round-trip of
+        several seconds; running them through asyncio.gather turns N serial
+        waits into one overlapping wait. Agent calls are side-effect-free, so
+        messages are appended in deterministic order after the gather.
+        """
+        all_agents = [session.primary_agent] + session.supporting_agents
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_AGENTS)
+
+        async def run_agent(agent_key):
+            adapter = self._adapter(agent_key, agents[agent_key])
+            agent_name = adapter.name
+
+            if not (adapter.process or adapter.process_async):
+                return agent_key, agent_name, None
+
+            # Get knowledge context if available (cached per query/agent)
+            knowledge_context = self._get_knowledge_context(
+                session, knowledge_retriever, agent_key
+            )
+
+            async with semaphore:
+                if adapter.process_async:
+                    # Natively async agents multiplex on this event loop
+                    result = await adapter.process_async(
+                        session.query,
+                        knowledge_context=knowledge_context,
+                        collaboration_context=None  # No context in parallel mode
+                    )
+                else:
+                    # Sync-only agents run on a worker thread; a persistent
+                    # executor keeps threads (and their HTTP keep-alive
+                    # connections) warm across queries
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        executor,
+                        partial(
+                            adapter.process,
+                            session.query,
+                            knowledge_context=knowledge_context,
+                            collaboration_context=None
+                        )
+                    )
+            return agent_key, agent_name, result
+
+        results = await asyncio.gather(
+            *(run_agent(key) for key in all_agents if key in agents),
+            return_exceptions=True
+        )
+
+        # State mutations happen on the main task, in dispatch order
+        for outcome in results:
+            if isinstance(outcome, BaseException):
+                session.add_message(AgentMessage(
+                    agent_name="unknown",
+                    content=f"Error: {outcome}",
+                    message_type="error",
+                    metadata={"error": str(outcome)}
+                ))
+                continue
+
+            agent_key, agent_name, result = outcome
+            if result is None:
+                continue
+            content = result.get("response", "No response")
+            session.add_message(AgentMessage(
+                agent_name=agent_name,
+                content=content,
+                message_type="response",
+                metadata={
+                    "success": result.get("success", False),
+                    "has_code": result.get("has_code", False)
+                }
+            ))
+            session.responses[agent_key] = content
+
+        session.status = "completed"
+        session.final_response = session.synthesize_responses()
+
+        return session
+
     def execute_single_agent(
         self,
         session: CollaborationSession,
@@ -295,28 +584,17 @@ class CollaborationManager:
             session.status = "failed"
             return session
         
-        agent = agents[agent_key]
-        agent_name = agent.agent_name if hasattr(agent, 'agent_name') else agent_key.upper()
+        adapter = self._adapter(agent_key, agents[agent_key])
+        agent_name = adapter.name
         
-        # Get knowledge context if available
-        # FIXED: Correct method name and parameter order
-        # The KnowledgeBase class has get_context_for_query(agent_type, query)
-        # not retrieve(query, agent_type)
-        knowledge_context = ""
-        if knowledge_retriever:
-            try:
-                knowledge_context = knowledge_retriever.get_context_for_query(
-                    agent_type=agent_key,
-                    query=session.query
-                )
-            except Exception as e:
-                # Log the error for debugging (was silently failing before)
-                print(f"Warning: Failed to retrieve knowledge context for {agent_key}: {e}")
-                pass
+        # Get knowledge context if available (cached per query/agent)
+        knowledge_context = self._get_knowledge_context(
+            session, knowledge_retriever, agent_key
+        )
         
         try:
-            if hasattr(agent, 'process'):
-                result = agent.process(
+            if adapter.process:
+                result = adapter.process(
                     session.query,
                     knowledge_context=knowledge_context,
                     collaboration_context=None
@@ -332,6 +610,7 @@ class CollaborationManager:
                     }
                 )
                 session.add_message(message)
+                session.responses[agent_key] = message.content
                 
         except Exception as e:
             error_message = AgentMessage(
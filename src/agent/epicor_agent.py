@@ -9,79 +9,63 @@ This agent specializes in:
 - ERP best practices
 """
 
-import anthropic
-from typing import Dict, Any, List, Optional
-import os
+# PERFORMANCE: anthropic (and transitively httpx/pydantic) is imported
+# lazily by BaseClaudeAgent.get_client, not at module load
+import hashlib
+import re
+from typing import Dict, Any, Final, List, Optional
 
+from src.agent.base import BaseClaudeAgent
+from src.agent.semantic_cache import ExactResponseCache, SemanticCache
 
-class EpicorP21Agent:
-    """Agent specialized in Epicor P21 ERP system"""
-    
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the Epicor P21 agent"""
-        self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-        if not self.api_key:
-            raise ValueError("ANTHROPIC_API_KEY is required")
-        
-        self.client = anthropic.Anthropic(api_key=self.api_key)
-        self.model = "claude-sonnet-4-20250514"
-        self.agent_name = "Epicor P21 Specialist"
-        
-    def process(
-        self, 
-        query: str, 
-        knowledge_context: str = "",
-        collaboration_context: Optional[List[Dict[str, str]]] = None
-    ) -> Dict[str, Any]:
-        """
-        Process a query related to Epicor P21
-        
-        Args:
-            query: User's question about Epicor P21
-            knowledge_context: Relevant documents from knowledge base
-            collaboration_context: Previous agent responses for collaboration
-            
-        Returns:
-            Dict with response, code examples, suggestions, and collaboration info
-        """
-        # Build the system prompt
-        system_prompt = self._build_system_prompt(knowledge_context)
-        
-        # Build the user message with collaboration context if available
-        user_message = self._build_user_message(query, collaboration_context)
-        
-        try:
-            # Call Claude API
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                system=system_prompt,
-                messages=[{
-                    "role": "user",
-                    "content": user_message
-                }]
-            )
-            
-            response_text = response.content[0].text
-            
-            # Parse the response
-            result = self._parse_response(response_text)
-            result["agent"] = self.agent_name
-            result["collaboration_enabled"] = collaboration_context is not None
-            
-            return result
-            
-        except Exception as e:
-            return {
-                "agent": self.agent_name,
-                "success": False,
-                "error": str(e),
-                "response": f"Error processing Epicor P21 query: {str(e)}"
-            }
-    
-    def _build_system_prompt(self, knowledge_context: str) -> str:
-        """Build the system prompt for the Epicor P21 agent"""
-        prompt = f"""You are an expert Epicor P21 ERP specialist with deep knowledge of:
+# PERFORMANCE: Shared semantic cache — paraphrased repeats of a prior query
+# return the cached result instead of a full Claude round-trip. The high
+# threshold keeps ERP answers from bleeding across genuinely different
+# questions. No-op when the embedding stack isn't installed.
+_SEMANTIC_CACHE = SemanticCache(similarity_threshold=0.95)
+
+# PERFORMANCE: Exact-match layer checked before the semantic one — identical
+# repeat prompts (test reruns, collaboration passes) hit with zero risk of
+# semantic drift, and the JSON backing file makes reruns instant
+_EXACT_CACHE = ExactResponseCache()
+
+# PERFORMANCE: Response parsing runs one compiled scan per concern instead
+# of five substring passes over a lowercased multi-KB copy
+_CODE_RE = re.compile(r"```(?:\w+)?\n?(.*?)```", re.DOTALL)
+_FLAGS_RE = re.compile(r"other agent|collaborate|next step|recommendation", re.IGNORECASE)
+
+# Collaboration trigger keywords, tagged by the domain they indicate
+_COLLAB_KEYWORDS = (
+    ("query", "sql"), ("select", "sql"), ("database", "sql"),
+    ("table", "sql"), ("join", "sql"),
+    ("c#", "csharp"), ("csharp", "csharp"), (".net", "csharp"),
+    ("api", "csharp"), ("integration", "csharp"), ("code", "csharp"),
+    ("p21", "p21"), ("epicor", "p21"),
+)
+
+# PERFORMANCE: With pyahocorasick installed, all keywords are found in one
+# linear DFA pass instead of one substring scan per keyword; without it the
+# plain scan below is the fallback
+try:
+    import ahocorasick
+    _COLLAB_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _tag in _COLLAB_KEYWORDS:
+        _COLLAB_AUTOMATON.add_word(_keyword, _tag)
+    _COLLAB_AUTOMATON.make_automaton()
+except ImportError:
+    _COLLAB_AUTOMATON = None
+
+
+def _keyword_tags(text: str) -> set:
+    """Set of domain tags whose keywords appear in the (lowercased) text"""
+    if _COLLAB_AUTOMATON is not None:
+        return {tag for _, tag in _COLLAB_AUTOMATON.iter(text)}
+    return {tag for keyword, tag in _COLLAB_KEYWORDS if keyword in text}
+
+# PERFORMANCE: The invariant expert prompt is built once at import — no
+# multi-KB f-string rebuild per call, and the byte-identical prefix is what
+# lets both the Anthropic ephemeral cache and the exact-match cache hit
+_EPICOR_SYSTEM: Final[str] = """You are an expert Epicor P21 ERP specialist with deep knowledge of:
 
 1. **Epicor P21 ERP System**:
    - Business processes and workflows
@@ -140,10 +124,210 @@ Structure your responses with:
 - Consider performance impact on production systems
 - Mention when to involve P21 support or consultants"""
 
-        if knowledge_context:
-            prompt += f"\n\n**Knowledge Base Context**:\n{knowledge_context}"
+
+class EpicorP21Agent(BaseClaudeAgent):
+    """Agent specialized in Epicor P21 ERP system"""
+
+    def __init__(self, api_key: Optional[str] = None,
+                 on_status: Optional[Any] = None):
+        """Initialize the Epicor P21 agent"""
+        super().__init__(api_key=api_key)
+        self.agent_name = "Epicor P21 Specialist"
+        # Optional callback fed partial response text while streaming
+        self.on_status = on_status
         
-        return prompt
+    def process(
+        self, 
+        query: str, 
+        knowledge_context: str = "",
+        collaboration_context: Optional[List[Dict[str, str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a query related to Epicor P21
+        
+        Args:
+            query: User's question about Epicor P21
+            knowledge_context: Relevant documents from knowledge base
+            collaboration_context: Previous agent responses for collaboration
+            
+        Returns:
+            Dict with response, code examples, suggestions, and collaboration info
+        """
+        # Build prompts + exact-cache digest in one fused pass
+        system_prompt, user_message, exact_key, _ = self._prepare_payload(
+            query, knowledge_context, collaboration_context
+        )
+
+        # PERFORMANCE: Cache layering is exact -> semantic -> API. The exact
+        # layer matches identical payloads outright; the semantic layer then
+        # catches paraphrased repeats of standalone queries.
+        cached = _EXACT_CACHE.get(exact_key)
+        if cached is not None:
+            cached["cache_hit"] = "exact"
+            return cached
+
+        if not collaboration_context:
+            cached = _SEMANTIC_CACHE.get(query)
+            if cached is not None:
+                cached["cache_hit"] = "semantic"
+                return cached
+
+        try:
+            # PERFORMANCE: Stream the response — callers watching on_status
+            # see text at time-to-first-token rather than after the full
+            # generation, and the chunks accumulate into the same result
+            chunks = []
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=4096,
+                system=system_prompt,
+                messages=[{
+                    "role": "user",
+                    "content": user_message
+                }]
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    if self.on_status and len(chunks) % 32 == 0:
+                        self.on_status("".join(chunks[-32:]))
+
+            response_text = "".join(chunks)
+            
+            # Parse the response
+            result = self._parse_response(response_text)
+            result["agent"] = self.agent_name
+            result["collaboration_enabled"] = collaboration_context is not None
+
+            if result.get("success"):
+                _EXACT_CACHE.put(exact_key, result)
+                if not collaboration_context:
+                    _SEMANTIC_CACHE.put(query, result)
+
+            return result
+            
+        except Exception as e:
+            return {
+                "agent": self.agent_name,
+                "success": False,
+                "error": str(e),
+                "response": f"Error processing Epicor P21 query: {str(e)}"
+            }
+
+    async def process_async(
+        self,
+        query: str,
+        knowledge_context: str = "",
+        collaboration_context: Optional[List[Dict[str, str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of process()
+
+        PERFORMANCE: Awaiting the AsyncAnthropic client lets the orchestrator
+        gather several agents' calls concurrently instead of serializing
+        multi-second round-trips
+        """
+        # Same fused payload build and cache layering as the sync path
+        system_prompt, user_message, exact_key, _ = self._prepare_payload(
+            query, knowledge_context, collaboration_context
+        )
+        cached = _EXACT_CACHE.get(exact_key)
+        if cached is not None:
+            cached["cache_hit"] = "exact"
+            return cached
+
+        if not collaboration_context:
+            cached = _SEMANTIC_CACHE.get(query)
+            if cached is not None:
+                cached["cache_hit"] = "semantic"
+                return cached
+
+        try:
+            chunks = []
+            async with self.async_client.messages.stream(
+                model=self.model,
+                max_tokens=4096,
+                system=system_prompt,
+                messages=[{
+                    "role": "user",
+                    "content": user_message
+                }]
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    if self.on_status and len(chunks) % 32 == 0:
+                        self.on_status("".join(chunks[-32:]))
+
+            result = self._parse_response("".join(chunks))
+            result["agent"] = self.agent_name
+            result["collaboration_enabled"] = collaboration_context is not None
+
+            if result.get("success"):
+                _EXACT_CACHE.put(exact_key, result)
+                if not collaboration_context:
+                    _SEMANTIC_CACHE.put(query, result)
+
+            return result
+
+        except Exception as e:
+            return {
+                "agent": self.agent_name,
+                "success": False,
+                "error": str(e),
+                "response": f"Error processing Epicor P21 query: {str(e)}"
+            }
+
+    def _prepare_payload(
+        self,
+        query: str,
+        knowledge_context: str,
+        collaboration_context: Optional[List[Dict[str, str]]]
+    ):
+        """Build prompts, cache digest and token estimate in one pass
+
+        PERFORMANCE: The prompt text used to be assembled, then re-serialized
+        and re-hashed separately for the exact cache. Here the digest is
+        updated incrementally as each chunk is produced, and ~len/4 gives a
+        cheap token estimate without a separate count_tokens call.
+
+        Returns:
+            (system_blocks, user_message, digest, approx_tokens)
+        """
+        hasher = hashlib.sha256(self.model.encode())
+        approx_tokens = 0
+
+        system_blocks = self._build_system_prompt(knowledge_context)
+        for block in system_blocks:
+            chunk = block["text"].encode()
+            hasher.update(chunk)
+            approx_tokens += len(chunk) // 4
+
+        user_message = self._build_user_message(query, collaboration_context)
+        chunk = user_message.encode()
+        hasher.update(chunk)
+        approx_tokens += len(chunk) // 4
+
+        return system_blocks, user_message, hasher.hexdigest(), approx_tokens
+
+    def _build_system_prompt(self, knowledge_context: str) -> List[Dict[str, Any]]:
+        """Build the system prompt as content blocks
+
+        PERFORMANCE: The ~1.5KB expert prompt never changes, so it carries an
+        ephemeral cache_control breakpoint — Anthropic's prompt cache serves
+        the prefix at a discount on every subsequent call. Only the per-query
+        knowledge context rides in an uncached block.
+        """
+        blocks = [{
+            "type": "text",
+            "text": _EPICOR_SYSTEM,
+            "cache_control": {"type": "ephemeral"}
+        }]
+        if knowledge_context:
+            blocks.append({
+                "type": "text",
+                "text": f"**Knowledge Base Context**:\n{knowledge_context}"
+            })
+
+        return blocks
     
     def _build_user_message(
         self, 
@@ -174,26 +358,23 @@ Structure your responses with:
             "response": response_text,
             "suggestions": []
         }
-        
-        # Extract code blocks if present
+
+        # Extract code blocks if present (one compiled-regex pass, no
+        # fragile even/odd split indexing)
         if "```" in response_text:
             result["has_code"] = True
-            # Extract code blocks
-            code_blocks = []
-            lines = response_text.split("```")
-            for i in range(1, len(lines), 2):
-                if i < len(lines):
-                    code_blocks.append(lines[i].strip())
-            result["code_blocks"] = code_blocks
-        
-        # Extract collaboration suggestions
-        if "other agent" in response_text.lower() or "collaborate" in response_text.lower():
+            result["code_blocks"] = [
+                m.group(1).strip() for m in _CODE_RE.finditer(response_text)
+            ]
+
+        # One case-insensitive pass sets the collaboration/recommendation
+        # flags without allocating a lowercased copy
+        flags = {m.lower() for m in _FLAGS_RE.findall(response_text)}
+        if "other agent" in flags or "collaborate" in flags:
             result["suggests_collaboration"] = True
-        
-        # Extract next steps or recommendations
-        if "next step" in response_text.lower() or "recommendation" in response_text.lower():
+        if "next step" in flags or "recommendation" in flags:
             result["has_recommendations"] = True
-        
+
         return result
     
     def suggest_collaboration(self, query: str, current_response: str) -> List[str]:
@@ -204,24 +385,18 @@ Structure your responses with:
             List of agent names that might be helpful
         """
         suggested_agents = []
-        
-        query_lower = query.lower()
-        response_lower = current_response.lower()
-        
-        # Check if SQL agent might help
-        if any(word in query_lower for word in ["query", "select", "database", "table", "join"]):
-            if "p21" in query_lower or "epicor" in query_lower:
-                suggested_agents.append("SQL Agent")
-        
-        # Check if C# agent might help
-        if any(word in query_lower for word in ["c#", "csharp", ".net", "api", "integration", "code"]):
+
+        # One pass over the query finds every trigger keyword at once
+        tags = _keyword_tags(query.lower())
+
+        # SQL agent helps with P21-flavored database questions
+        if "sql" in tags and "p21" in tags:
+            suggested_agents.append("SQL Agent")
+
+        # C# agent helps with implementation/integration questions
+        if "csharp" in tags:
             suggested_agents.append("C# Agent")
-        
-        # Check if response indicates need for collaboration
-        if any(phrase in response_lower for phrase in ["would also need", "might also", "could use", "work with"]):
-            # Could suggest specific agents based on context
-            pass
-        
+
         return suggested_agents
 
 
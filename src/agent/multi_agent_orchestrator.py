@@ -5,21 +5,217 @@ Routes queries to specialized agents and manages multi-agent collaboration.
 Supports single agent, sequential collaboration, and parallel collaboration modes.
 """
 
+import asyncio
+import json
+import logging
+import queue
+import re
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
-from typing import Optional, Callable, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Callable, Dict, Any, List, Tuple
+from dataclasses import asdict, dataclass, field
 from enum import Enum
+from functools import cached_property
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Allow running this module directly as a script (python src/...py) — when
+# imported as part of the src package, src/__init__ handles the path setup
+if __package__ in (None, ""):
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from config import config
-from src.agent.router import RouterAgent
-from src.agent.orchestrator import VoiceToSQLAgent
-from src.agent.csharp_agent import CSharpAgent
-from src.agent.epicor_agent import EpicorP21Agent
 from src.agent.collaboration import CollaborationManager, CollaborationSession
-from src.knowledge.retriever import KnowledgeRetriever
+
+# PERFORMANCE: orjson serializes the nested, emoji-heavy session payloads
+# 3-10x faster than stdlib json; fall back when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# PERFORMANCE: Status goes through logging with lazy %-args — when no
+# handler is enabled nothing is formatted and nothing blocks on the TTY.
+# The NullHandler keeps library use silent; verbose CLI runs attach a
+# StreamHandler in __init__.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# PERFORMANCE: The agent modules (and their anthropic/whisper/torch deps)
+# are imported inside MultiAgentOrchestrator.__init__ — importing this
+# module for its types stays cheap
+
+
+# PERFORMANCE: Micro-batching window — bursts of queries routed to the same
+# agent within the window ride one Claude call, amortizing per-call network
+# and time-to-first-token overhead at the cost of <=250ms extra latency
+BATCH_WINDOW_SECONDS = 0.25
+BATCH_MAX_QUERIES = 8
+
+_ANSWER_SPLIT_RE = re.compile(r"^ANSWER (\d+):\s*$", re.MULTILINE)
+
+# PERFORMANCE: Trivial-route fast path — queries whose keywords unambiguously
+# name one domain skip the router's Claude round-trip entirely
+_TRIVIAL_ROUTER = re.compile(
+    r"(?P<sql>\b(?:select|join|where|group by)\b)"
+    r"|(?P<csharp>\b(?:linq|async|await|nuget|csharp)\b|c#|\.net)"
+    r"|(?P<epicor>\b(?:p21|epicor)\b)",
+    re.IGNORECASE
+)
+
+
+def _trivial_route(query: str) -> Optional[Dict[str, Any]]:
+    """Keyword-match routing for unambiguous queries, or None
+
+    Mirrors RouterAgent._rule_based_route's guard: exactly one domain AND at
+    least two keyword hits — a single stray "where" or "async" is not
+    enough to skip the LLM router.
+    """
+    counts: Dict[str, int] = {}
+    for m in _TRIVIAL_ROUTER.finditer(query):
+        counts[m.lastgroup] = counts.get(m.lastgroup, 0) + 1
+    if len(counts) != 1:
+        return None
+    agent, hits = counts.popitem()
+    if hits < 2:
+        return None
+    return {
+        "primary_agent": agent,
+        "supporting_agents": [],
+        "collaboration_mode": "single",
+        "confidence": "high",
+        "reasoning": f"{hits} unambiguous {agent} keywords, routed without the LLM router"
+    }
+
+
+def _split_numbered_answers(response_text: str, count: int) -> List[str]:
+    """Split a batched 'ANSWER <n>:' response into per-query answers"""
+    pieces = _ANSWER_SPLIT_RE.split(response_text)
+    # pieces = [preamble, "1", answer1, "2", answer2, ...]
+    answers = {}
+    for i in range(1, len(pieces) - 1, 2):
+        answers[int(pieces[i])] = pieces[i + 1].strip()
+    if len(answers) < count:
+        # Parsing failed — every caller gets the full response
+        return [response_text] * count
+    return [answers.get(i + 1, response_text) for i in range(count)]
+
+
+class _QueryBatcher:
+    """Coalesces bursts of same-agent queries into single Claude calls"""
+
+    def __init__(self, agents: Dict[str, Any]):
+        self._agents = agents
+        self._pending: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+        self._flush_handles: Dict[str, asyncio.TimerHandle] = {}
+
+    async def submit(self, agent_key: str, query: str) -> Dict[str, Any]:
+        """Queue a query for its agent and await the (batched) answer"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        bucket = self._pending.setdefault(agent_key, [])
+        bucket.append((query, future))
+
+        if len(bucket) >= BATCH_MAX_QUERIES:
+            self._flush(agent_key)
+        elif agent_key not in self._flush_handles:
+            self._flush_handles[agent_key] = loop.call_later(
+                BATCH_WINDOW_SECONDS, self._flush, agent_key
+            )
+        return await future
+
+    def _flush(self, agent_key: str):
+        handle = self._flush_handles.pop(agent_key, None)
+        if handle is not None:
+            handle.cancel()
+        batch = self._pending.pop(agent_key, [])
+        if batch:
+            asyncio.ensure_future(self._run_batch(agent_key, batch))
+
+    async def _run_batch(self, agent_key: str, batch: List[Tuple[str, asyncio.Future]]):
+        agent = self._agents[agent_key]
+        try:
+            if len(batch) == 1:
+                query, future = batch[0]
+                result = await self._call_agent(agent, query)
+                future.set_result(result)
+                return
+
+            numbered = "\n".join(f"{i}. {query}" for i, (query, _) in enumerate(batch, 1))
+            combined = (
+                "Answer each of the following numbered queries separately. "
+                "Start each answer with 'ANSWER <n>:' on its own line.\n\n"
+                + numbered
+            )
+            result = await self._call_agent(agent, combined)
+            answers = _split_numbered_answers(result.get("response", ""), len(batch))
+            for (query, future), answer in zip(batch, answers):
+                per_query = dict(result)
+                per_query["response"] = answer
+                future.set_result(per_query)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    @staticmethod
+    async def _call_agent(agent: Any, query: str) -> Dict[str, Any]:
+        if hasattr(agent, 'process_async'):
+            return await agent.process_async(query)
+        return await asyncio.to_thread(agent.process, query)
+
+
+# PERFORMANCE: fast_route_and_answer folds routing into the primary call —
+# one Claude round-trip returns both the classification and the answer
+# Fallback dispatch table for transcripts that predate session.responses —
+# one cached .upper() per message and C-level startswith, no substring scans
+_AGENT_PREFIX = (
+    ("SQL", "sql"),
+    ("CSHARP", "csharp"),
+    ("C#", "csharp"),
+    ("EPICOR", "epicor"),
+    ("P21", "epicor"),
+)
+
+_FAST_ROUTE_SYSTEM = """You are part of a multi-agent assistant covering three domains:
+- "sql": natural-language questions answered against a PostgreSQL database
+- "csharp": C# and .NET programming help
+- "epicor": Epicor P21 ERP operations, exports, database and API integration
+
+Classify the user's query AND answer it in one shot. Respond with ONLY a
+JSON object, no code fences, in this exact shape:
+{"agent": "sql|csharp|epicor", "confidence": "high|medium|low", "answer": "<your full answer>"}"""
+
+
+class _LazyAgentMap:
+    """Mapping that constructs each agent on first access
+
+    PERFORMANCE: An SQL-only query never pays for the C#/Epicor clients or
+    their imports; agents are built once and cached thereafter.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[], Any]]):
+        self._factories = factories
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        agent = self._cache.get(key)
+        if agent is None:
+            agent = self._factories[key]()
+            self._cache[key] = agent
+        return agent
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._factories
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
 
 
 class AgentType(Enum):
@@ -29,9 +225,13 @@ class AgentType(Enum):
     EPICOR = "epicor"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MultiAgentResult:
-    """Result from the multi-agent system"""
+    """Result from the multi-agent system
+
+    Immutable once built — the rendered header is cached for results that
+    get printed repeatedly (console + logs + file).
+    """
     success: bool
     mode: str  # single, sequential, parallel
     agents_used: list
@@ -60,25 +260,43 @@ class MultiAgentResult:
     # Errors
     routing_error: Optional[str] = None
     execution_error: Optional[str] = None
-    
+
+    # PERFORMANCE: Rendered header, computed once per (immutable) result
+    _header_cache: Optional[str] = field(default=None, init=False, repr=False)
+
+    @property
+    def _header(self) -> str:
+        if self._header_cache is None:
+            # frozen dataclass: write the cache slot through object.__setattr__
+            object.__setattr__(self, "_header_cache", (
+                f"🤖 Agents: {', '.join(a.upper() for a in self.agents_used)}\n"
+                f"🔄 Mode: {self.mode.upper()}\n"
+                f"📊 Confidence: {self.routing_confidence}\n"
+            ))
+        return self._header_cache
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form (collaboration_session is already primitives)"""
+        result = asdict(self)
+        result.pop("_header_cache", None)
+        return result
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes for HTTP responses / logs"""
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict()).encode("utf-8")
+
     def __str__(self):
-        lines = []
-        
-        lines.append(f"🤖 Agents: {', '.join([a.upper() for a in self.agents_used])}")
-        lines.append(f"🔄 Mode: {self.mode.upper()}")
-        lines.append(f"📊 Confidence: {self.routing_confidence}")
-        lines.append("")
-        
-        if self.final_response:
-            lines.append(self.final_response)
-        
-        if not self.success:
-            if self.routing_error:
-                lines.append(f"❌ Routing Error: {self.routing_error}")
-            if self.execution_error:
-                lines.append(f"❌ Execution Error: {self.execution_error}")
-        
-        return "\n".join(lines)
+        # PERFORMANCE: Cached header + one expression, one string allocation
+        return (
+            self._header
+            + (f"\n{self.final_response}" if self.final_response else "")
+            + (f"\n❌ Routing Error: {self.routing_error}"
+               if not self.success and self.routing_error else "")
+            + (f"\n❌ Execution Error: {self.execution_error}"
+               if not self.success and self.execution_error else "")
+        )
 
 
 class MultiAgentOrchestrator:
@@ -90,35 +308,88 @@ class MultiAgentOrchestrator:
     def __init__(
         self,
         on_status: Optional[Callable[[str], None]] = None,
-        verbose: bool = True
+        verbose: bool = True,
+        enable_batching: bool = False
     ):
         self.on_status = on_status
         self.verbose = verbose
+        # Opt-in: trades up to BATCH_WINDOW_SECONDS of latency for burst
+        # throughput (see process_query_batched)
+        self.enable_batching = enable_batching
+
+        self._log_listener: Optional[QueueListener] = None
+        if verbose and all(isinstance(h, logging.NullHandler) for h in logger.handlers):
+            # PERFORMANCE: Worker threads only enqueue records; the listener
+            # thread owns the stdout writes, so parallel collaboration never
+            # serializes through the TTY lock on its critical path
+            log_queue = queue.SimpleQueue()
+            stream_handler = logging.StreamHandler(sys.stdout)
+            stream_handler.setFormatter(logging.Formatter("%(message)s"))
+            self._log_listener = QueueListener(log_queue, stream_handler)
+            self._log_listener.start()
+            logger.addHandler(QueueHandler(log_queue))
+            logger.setLevel(logging.INFO)
         
-        # Initialize router
+        from src.agent.router import RouterAgent
+
+        # Initialize router (needed for every query)
         self.router = RouterAgent(api_key=config.ANTHROPIC_API_KEY)
-        
-        # Initialize specialized agents
-        self.agents = {
-            "sql": VoiceToSQLAgent(on_status=on_status, verbose=verbose),
-            "csharp": CSharpAgent(api_key=config.ANTHROPIC_API_KEY),
-            "epicor": EpicorP21Agent(api_key=config.ANTHROPIC_API_KEY)
-        }
+
+        # Specialized agents are built lazily on first routed use; the
+        # factories also defer each agent module's import
+        def _make_sql():
+            from src.agent.orchestrator import VoiceToSQLAgent
+            return VoiceToSQLAgent(on_status=on_status, verbose=verbose)
+
+        def _make_csharp():
+            from src.agent.csharp_agent import CSharpAgent
+            return CSharpAgent(api_key=config.ANTHROPIC_API_KEY)
+
+        def _make_epicor():
+            from src.agent.epicor_agent import EpicorP21Agent
+            return EpicorP21Agent(api_key=config.ANTHROPIC_API_KEY, on_status=on_status)
+
+        self.agents = _LazyAgentMap({
+            "sql": _make_sql,
+            "csharp": _make_csharp,
+            "epicor": _make_epicor,
+        })
         
         # Initialize collaboration manager
         self.collaboration_manager = CollaborationManager()
+
+        # Lazily created coalescing batcher (needs a running event loop)
+        self._batcher: Optional[_QueryBatcher] = None
+
+        # PERFORMANCE: One long-lived worker pool shared across queries —
+        # re-creating pools per query pays thread startup and drops the
+        # agents' warm HTTP connections
+        self._pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("TOOL_CONCURRENCY_LIMIT", "4")),
+            thread_name_prefix="agent"
+        )
         
-        # Initialize knowledge retriever
+    @cached_property
+    def knowledge_retriever(self):
+        """The knowledge retriever, constructed on first use
+
+        PERFORMANCE: Defers the knowledge-base load until an agent actually
+        asks for context, keeping single-agent cold starts lean
+        """
         try:
-            self.knowledge_retriever = KnowledgeRetriever()
-        except:
-            self.knowledge_retriever = None
-            self._status("⚠️  Knowledge base not available")
-    
+            # Imported inside the try: a missing/renamed knowledge module is
+            # exactly the ImportError this guard exists to absorb
+            from src.knowledge.retriever import KnowledgeBase
+            return KnowledgeBase()
+        except (ImportError, FileNotFoundError, OSError, RuntimeError) as e:
+            # A bare except here used to swallow everything, including
+            # KeyboardInterrupt, and hid the real reason the KB was missing
+            self._status(f"⚠️  Knowledge base not available: {e}")
+            return None
+
     def _status(self, message: str):
         """Emit a status message."""
-        if self.verbose:
-            print(message)
+        logger.info("%s", message)
         if self.on_status:
             self.on_status(message)
     
@@ -134,8 +405,10 @@ class MultiAgentOrchestrator:
         """
         self._status("🔍 Analyzing query and determining agent strategy...")
         
-        # Route the query
-        routing = self.router.route(query)
+        # Route the query (regex fast path first, LLM router for the rest)
+        routing = _trivial_route(query)
+        if routing is None:
+            routing = self.router.route(query)
         
         primary_agent = routing["primary_agent"]
         supporting_agents = routing["supporting_agents"]
@@ -175,8 +448,14 @@ class MultiAgentOrchestrator:
                 
             elif mode == "parallel":
                 self._status(f"⚡ Parallel collaboration: {', '.join([primary_agent.upper()] + [a.upper() for a in supporting_agents])}")
-                session = self.collaboration_manager.execute_parallel_collaboration(
-                    session, self.agents, self.knowledge_retriever
+                # PERFORMANCE: The async executor gathers the agents' calls
+                # concurrently (async clients where available), so parallel
+                # mode pays max-of-latencies rather than sum-of-latencies
+                session = asyncio.run(
+                    self.collaboration_manager.execute_parallel_collaboration_async(
+                        session, self.agents, self.knowledge_retriever,
+                        executor=self._pool
+                    )
                 )
             
             self._status("✅ Collaboration complete!")
@@ -201,22 +480,24 @@ class MultiAgentOrchestrator:
         
         agents_used = [session.primary_agent] + session.supporting_agents
         
-        # Extract specific responses
-        sql_response = None
-        sql_results = None
-        csharp_response = None
-        epicor_response = None
-        
-        for msg in session.messages:
-            if "SQL" in msg.agent_name.upper():
-                sql_response = msg.content
-                # Try to extract SQL and results
-                if "```sql" in msg.content.lower():
-                    sql_response = msg.content
-            elif "C#" in msg.agent_name.upper() or "CSHARP" in msg.agent_name.upper():
-                csharp_response = msg.content
-            elif "EPICOR" in msg.agent_name.upper() or "P21" in msg.agent_name.upper():
-                epicor_response = msg.content
+        # PERFORMANCE: Responses are recorded per canonical agent key during
+        # execution, so extraction is three dict lookups — no transcript
+        # scan, no .upper() copies, no substring matching
+        responses = session.responses
+        if not responses and session.messages:
+            # Older sessions carry only the transcript: uppercase each name
+            # once and dispatch on prefixes
+            responses = {}
+            for msg in session.messages:
+                name = msg.agent_name.upper()
+                for prefix, key in _AGENT_PREFIX:
+                    if name.startswith(prefix):
+                        responses[key] = msg.content
+                        break
+
+        sql_response = responses.get("sql")
+        csharp_response = responses.get("csharp")
+        epicor_response = responses.get("epicor")
         
         return MultiAgentResult(
             success=session.status == "completed",
@@ -231,6 +512,132 @@ class MultiAgentOrchestrator:
             epicor_response=epicor_response
         )
     
+    def fast_route_and_answer(self, query: str) -> MultiAgentResult:
+        """
+        Answer a query with a single Claude call that also classifies it
+
+        PERFORMANCE: The normal single-agent path pays two sequential LLM
+        round-trips (route, then answer). Here one structured-output call
+        returns both; malformed JSON falls back to the two-call path.
+        """
+        try:
+            response = self.router.client.messages.create(
+                model=self.router.model,
+                max_tokens=2048,
+                system=_FAST_ROUTE_SYSTEM,
+                messages=[
+                    {"role": "user", "content": query},
+                    # Prefill the opening brace to anchor the JSON output
+                    {"role": "assistant", "content": "{"}
+                ]
+            )
+            payload = json.loads("{" + response.content[0].text)
+            agent = payload["agent"]
+            answer = payload["answer"]
+            if agent not in self.agents:
+                raise ValueError(f"unknown agent {agent!r}")
+        except Exception as e:
+            self._status(f"⚠️  Fast route failed ({e}), using the two-call path")
+            return self.process_query(query)
+
+        return MultiAgentResult(
+            success=True,
+            mode="single",
+            agents_used=[agent],
+            routing_confidence=payload.get("confidence", "medium"),
+            query=query,
+            final_response=answer
+        )
+
+    async def aprocess_query(self, query: str) -> MultiAgentResult:
+        """
+        Async sibling of process_query
+
+        PERFORMANCE: Parallel collaboration awaits the agents' async clients
+        directly on the caller's event loop (sum-of-latencies becomes
+        max-of-latencies); routing and the other modes run on worker threads
+        so the loop is never blocked.
+        """
+        routing = _trivial_route(query)
+        if routing is None:
+            routing = await asyncio.to_thread(self.router.route, query)
+
+        if routing["collaboration_mode"] != "parallel":
+            return await asyncio.to_thread(self.process_query, query)
+
+        session = self.collaboration_manager.create_session(
+            query=query,
+            primary_agent=routing["primary_agent"],
+            supporting_agents=routing["supporting_agents"],
+            mode=routing["collaboration_mode"]
+        )
+        try:
+            session = await self.collaboration_manager.execute_parallel_collaboration_async(
+                session, self.agents, self.knowledge_retriever,
+                executor=self._pool
+            )
+            return self._build_result(session, routing)
+        except Exception as e:
+            return MultiAgentResult(
+                success=False,
+                mode=routing["collaboration_mode"],
+                agents_used=[routing["primary_agent"]],
+                routing_confidence=routing.get("confidence", "unknown"),
+                query=query,
+                execution_error=str(e)
+            )
+
+    async def process_query_batched(self, query: str) -> Dict[str, Any]:
+        """
+        Process a single-agent query through the coalescing batcher
+
+        PERFORMANCE: Queries arriving within BATCH_WINDOW_SECONDS that route
+        to the same agent share one Claude call. Collaboration modes,
+        disabled batching, and the SQL agent fall back to the normal path
+        on a worker thread.
+        """
+        if not self.enable_batching:
+            return (await asyncio.to_thread(self.process_query, query)).to_dict()
+
+        # Routing is a multi-second Claude round-trip: keep it off the event
+        # loop or concurrent submit()s can never accumulate inside the window
+        routing = await asyncio.to_thread(self.router.route, query)
+
+        # The SQL agent answers each question with one generated query, so a
+        # numbered multi-question prompt has nothing to batch — and it only
+        # exposes process_text, not the process/process_async batch protocol
+        if routing["collaboration_mode"] != "single" or routing["primary_agent"] == "sql":
+            return (await asyncio.to_thread(self.process_query, query)).to_dict()
+
+        if self._batcher is None:
+            self._batcher = _QueryBatcher(self.agents)
+        agent_result = await self._batcher.submit(routing["primary_agent"], query)
+
+        # Normalize to the same MultiAgentResult dict shape the fallback
+        # paths return, so callers never branch on which path ran
+        return MultiAgentResult(
+            success=agent_result.get("success", False),
+            mode="single",
+            agents_used=[routing["primary_agent"]],
+            routing_confidence=routing.get("confidence", "unknown"),
+            query=query,
+            final_response=agent_result.get("response"),
+            execution_error=agent_result.get("error")
+        ).to_dict()
+
+    def close(self):
+        """Release the shared worker pool and stop the log listener"""
+        self._pool.shutdown(wait=False)
+        if self._log_listener is not None:
+            self._log_listener.stop()
+            self._log_listener = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def process_text(self, text: str) -> MultiAgentResult:
         """Process text input (alias for process_query)"""
         return self.process_query(text)
@@ -261,11 +668,30 @@ if __name__ == "__main__":
         "Build a P21 integration API with async database operations"
     ]
     
+    results = []
     for i, query in enumerate(test_queries, 1):
         print(f"\n{'=' * 70}")
         print(f"TEST {i}: {query}")
         print(f"{'=' * 70}\n")
         
         result = orchestrator.process_query(query)
+        results.append(result)
         print(f"\n{result}")
         print()
+
+    # PERFORMANCE: Warm the semantic cache with this run's corpus — one
+    # batched encode for any queries the run didn't already absorb — and
+    # persist the warm set so the next invocation starts with hits
+    from src.agent.epicor_agent import _SEMANTIC_CACHE
+
+    if _SEMANTIC_CACHE.available:
+        warm_pairs = [
+            (query, {"success": True, "response": result.final_response,
+                     "cache_hit": "warm"})
+            for query, result in zip(test_queries, results)
+            if result.success and result.final_response
+        ]
+        missing = [(q, r) for q, r in warm_pairs if _SEMANTIC_CACHE.get(q) is None]
+        if missing:
+            _SEMANTIC_CACHE.warm([q for q, _ in missing], [r for _, r in missing])
+        _SEMANTIC_CACHE.save_warm()
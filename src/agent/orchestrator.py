@@ -3,13 +3,17 @@ Agent Orchestrator.
 Coordinates the full pipeline from audio to SQL results.
 """
 
-import sys
-import os
 from typing import Optional, Callable
 from dataclasses import dataclass
 from enum import Enum
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Allow running this module directly as a script (python src/...py) — when
+# imported as part of the src package, src/__init__ handles the path setup
+if __package__ in (None, ""):
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from config import config
 from src.audio.capture import record_with_vad, record_audio
@@ -25,7 +29,7 @@ class QueryMode(Enum):
     MICROPHONE = "mic"      # Live microphone
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineResult:
     """Result of running the full pipeline."""
     success: bool
@@ -113,36 +117,43 @@ class VoiceToSQLAgent:
         Returns:
             PipelineResult with SQL and results
         """
-        result = PipelineResult(
-            success=False,
-            mode=QueryMode.TEXT,
-            transcription=text
-        )
-        
         # Generate SQL
         self._status("Generating SQL...")
         sql_result = generate_sql(text)
-        
+
         if not sql_result['success']:
-            result.sql_generation_error = sql_result['error']
-            return result
-        
-        result.generated_sql = sql_result['sql']
-        
+            return PipelineResult(
+                success=False,
+                mode=QueryMode.TEXT,
+                transcription=text,
+                sql_generation_error=sql_result['error']
+            )
+
         # Execute query
         self._status("Executing query...")
         query_result = execute_query(sql_result['sql'])
-        result.query_result = query_result.to_dict()
-        
+
         if not query_result.success:
-            result.execution_error = query_result.error
-            return result
-        
-        # Format results
-        result.formatted_output = format_results_natural(query_result)
-        result.success = True
-        
-        return result
+            return PipelineResult(
+                success=False,
+                mode=QueryMode.TEXT,
+                transcription=text,
+                generated_sql=sql_result['sql'],
+                query_result=query_result.to_dict(),
+                execution_error=query_result.error
+            )
+
+        # PERFORMANCE: The hot success path allocates one fully populated
+        # result at the end instead of building a default-heavy instance up
+        # front and mutating it field by field
+        return PipelineResult(
+            success=True,
+            mode=QueryMode.TEXT,
+            transcription=text,
+            generated_sql=sql_result['sql'],
+            query_result=query_result.to_dict(),
+            formatted_output=format_results_natural(query_result)
+        )
     
     def process_audio_file(self, audio_path: str) -> PipelineResult:
         """
@@ -3,14 +3,18 @@ Audio Capture Module.
 Handles microphone input for voice queries.
 """
 
-import os
-import sys
 import numpy as np
 from typing import Optional, Callable
 import threading
 import queue
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Allow running this module directly as a script (python src/...py) — when
+# imported as part of the src package, src/__init__ handles the path setup
+if __package__ in (None, ""):
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
 from config import config
 
 
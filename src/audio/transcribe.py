@@ -4,11 +4,16 @@ Transcribes audio files or numpy arrays to text.
 """
 
 import os
-import sys
 import numpy as np
 from typing import Optional, Union
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Allow running this module directly as a script (python src/...py) — when
+# imported as part of the src package, src/__init__ handles the path setup
+if __package__ in (None, ""):
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
 from config import config
 
 # Lazy load whisper to speed up imports
@@ -16,12 +16,16 @@ import psycopg2  # PostgreSQL database connector
 from psycopg2 import sql as psycopg2_sql
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, ISOLATION_LEVEL_READ_COMMITTED
 from typing import List, Dict, Any, Optional
-import sys
-import os
 import time
 import re
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# Allow running this module directly as a script (python src/...py) — when
+# imported as part of the src package, src/__init__ handles the path setup
+if __package__ in (None, ""):
+    import os
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
 from config import config
 
 
@@ -517,17 +521,18 @@ if __name__ == "__main__":
     
     # Test 2: Select with limit
     print("\nTest 2: List products")
-    result = execute_query("SELECT sku, name, unit_price FROM products LIMIT 5;")
+    # products_v exposes dollar amounts over the cents-based schema
+    result = execute_query("SELECT sku, name, unit_price FROM products_v LIMIT 5;")
     print(format_results_table(result))
     
     # Test 3: Aggregation
     print("\nTest 3: Sales by customer")
     result = execute_query("""
-        SELECT c.company_name, COUNT(o.id) as order_count, SUM(o.total) as total_sales
+        SELECT c.company_name, COUNT(o.id) as order_count, SUM(o.total_cents) as total_sales_cents
         FROM customers c
         JOIN orders o ON c.id = o.customer_id
         GROUP BY c.company_name
-        ORDER BY total_sales DESC
+        ORDER BY total_sales_cents DESC
         LIMIT 5;
     """)
     print(format_results_table(result))
@@ -15,7 +15,7 @@ source venv/bin/activate
 
 # Check if database is set up
 echo "Checking configuration..."
-python3 -c "from config import Config; errors = Config.validate(); print('✅ Configuration OK' if not errors else '⚠️  ' + errors[0])"
+python3 -c "from config import config; errors = config.validate(); print('✅ Configuration OK' if not errors else '⚠️  ' + errors[0])"
 echo ""
 
 echo "🌐 Starting server..."
@@ -29,7 +29,7 @@ from functools import wraps
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from config import Config
+from config import config
 from src.agent.multi_agent_orchestrator import MultiAgentOrchestrator
 
 # SECURITY: Import security modules
@@ -49,21 +49,21 @@ except ImportError:
 app = Flask(__name__)
 
 # SECURITY: Set maximum request size to prevent memory exhaustion
-app.config['MAX_CONTENT_LENGTH'] = Config.MAX_REQUEST_SIZE_MB * 1024 * 1024
+app.config['MAX_CONTENT_LENGTH'] = config.MAX_REQUEST_SIZE_MB * 1024 * 1024
 
 # SECURITY: Disable debug mode in production (exposes sensitive info)
-app.config['DEBUG'] = Config.DEBUG
+app.config['DEBUG'] = config.DEBUG
 
 # SECURITY: Set secure session configuration
-app.config['SECRET_KEY'] = Config.JWT_SECRET_KEY or os.urandom(32)
-app.config['SESSION_COOKIE_SECURE'] = Config.HTTPS_ONLY  # Only send cookie over HTTPS
+app.config['SECRET_KEY'] = config.JWT_SECRET_KEY or os.urandom(32)
+app.config['SESSION_COOKIE_SECURE'] = config.HTTPS_ONLY  # Only send cookie over HTTPS
 app.config['SESSION_COOKIE_HTTPONLY'] = True  # Prevent JavaScript access
 app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'  # CSRF protection
 
 # SECURITY: Configure CORS (Cross-Origin Resource Sharing)
 # Only allow requests from trusted origins
-if Config.CORS_ORIGINS:
-    origins = [origin.strip() for origin in Config.CORS_ORIGINS.split(',')]
+if config.CORS_ORIGINS:
+    origins = [origin.strip() for origin in config.CORS_ORIGINS.split(',')]
     CORS(app, origins=origins, supports_credentials=True)
 
 # Global queue for logging messages
@@ -95,14 +95,14 @@ def before_request():
     - Content type validation
     """
     # SECURITY: Enforce HTTPS in production
-    if Config.HTTPS_ONLY and not request.is_secure:
+    if config.HTTPS_ONLY and not request.is_secure:
         return jsonify({
             'error': 'HTTPS Required',
             'message': 'This API requires HTTPS connections'
         }), 403
     
     # SECURITY: Log request for audit trail
-    if SECURITY_ENABLED and Config.ENABLE_AUDIT_LOGGING:
+    if SECURITY_ENABLED and config.ENABLE_AUDIT_LOGGING:
         try:
             audit_logger.log_api_call(
                 endpoint=request.endpoint or request.path,
@@ -153,7 +153,7 @@ def after_request(response):
     
     # SECURITY: Strict-Transport-Security (HSTS)
     # Forces HTTPS connections
-    if Config.HTTPS_ONLY:
+    if config.HTTPS_ONLY:
         response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
     
     # SECURITY: Referrer-Policy
@@ -195,7 +195,7 @@ def internal_error(error):
     SECURITY: Generic error message prevents information disclosure
     """
     # SECURITY: Log error for debugging but don't expose to user
-    if Config.DEBUG:
+    if config.DEBUG:
         import traceback
         print("Internal Error:", traceback.format_exc())
     
@@ -210,7 +210,7 @@ def request_too_large(error):
     """Handle oversized requests."""
     return jsonify({
         'error': 'Request Too Large',
-        'message': f'Request size exceeds maximum of {Config.MAX_REQUEST_SIZE_MB}MB'
+        'message': f'Request size exceeds maximum of {config.MAX_REQUEST_SIZE_MB}MB'
     }), 413
 
 
@@ -230,23 +230,23 @@ def get_config():
     
     SECURITY: Public endpoint with redacted sensitive values
     """
-    errors = Config.validate()
+    errors = config.validate()
     
     # SECURITY: Redact sensitive configuration values
     return jsonify({
-        'anthropic_configured': bool(Config.ANTHROPIC_API_KEY),
-        'database_configured': bool(Config.DATABASE_URL),
-        'whisper_model': Config.WHISPER_MODEL,
-        'auth_required': Config.REQUIRE_AUTH,
-        'rate_limiting': Config.ENABLE_RATE_LIMITING,
-        'environment': Config.ENVIRONMENT,
+        'anthropic_configured': bool(config.ANTHROPIC_API_KEY),
+        'database_configured': bool(config.DATABASE_URL),
+        'whisper_model': config.WHISPER_MODEL,
+        'auth_required': config.REQUIRE_AUTH,
+        'rate_limiting': config.ENABLE_RATE_LIMITING,
+        'environment': config.ENVIRONMENT,
         'security_enabled': SECURITY_ENABLED,
         'errors': errors,
         'ready': len(errors) == 0
     })
 
 @app.route('/api/query', methods=['POST'])
-@rate_limit('authenticated' if Config.REQUIRE_AUTH else 'default')  # Apply rate limiting
+@rate_limit('authenticated' if config.REQUIRE_AUTH else 'default')  # Apply rate limiting
 def process_query():
     """
     Process a text query with multi-agent collaboration.
@@ -398,7 +398,7 @@ def process_query():
                         severity='ERROR'
                     )
                 
-                if Config.DEBUG:
+                if config.DEBUG:
                     import traceback
                     traceback.print_exc()
                     return {
@@ -432,7 +432,7 @@ def process_query():
                 severity='ERROR'
             )
         
-        if Config.DEBUG:
+        if config.DEBUG:
             return jsonify({'success': False, 'error': str(e)}), 500
         else:
             return jsonify({
@@ -513,7 +513,7 @@ def test_connection():
             )
         
         # SECURITY: Don't expose detailed error in production
-        if Config.DEBUG:
+        if config.DEBUG:
             return jsonify({'success': False, 'error': str(e)})
         else:
             return jsonify({'success': False, 'error': 'Database connection failed'})
@@ -524,7 +524,7 @@ if __name__ == '__main__':
     print("="*70)
     
     # SECURITY: Print configuration
-    Config.print_config()
+    config.print_config()
     
     print("\n📝 Setup Instructions:")
     print("   1. Make sure PostgreSQL is running")
@@ -534,14 +534,14 @@ if __name__ == '__main__':
     
     print("\n🔒 Security Status:")
     print(f"   • Security Modules: {'✅ Enabled' if SECURITY_ENABLED else '❌ Disabled'}")
-    print(f"   • Authentication: {'✅ Required' if Config.REQUIRE_AUTH else '⚠️  Optional'}")
-    print(f"   • Rate Limiting: {'✅ Enabled' if Config.ENABLE_RATE_LIMITING else '❌ Disabled'}")
-    print(f"   • Audit Logging: {'✅ Enabled' if Config.ENABLE_AUDIT_LOGGING else '❌ Disabled'}")
-    print(f"   • HTTPS Only: {'✅ Yes' if Config.HTTPS_ONLY else '⚠️  No'}")
-    print(f"   • Environment: {Config.ENVIRONMENT}")
+    print(f"   • Authentication: {'✅ Required' if config.REQUIRE_AUTH else '⚠️  Optional'}")
+    print(f"   • Rate Limiting: {'✅ Enabled' if config.ENABLE_RATE_LIMITING else '❌ Disabled'}")
+    print(f"   • Audit Logging: {'✅ Enabled' if config.ENABLE_AUDIT_LOGGING else '❌ Disabled'}")
+    print(f"   • HTTPS Only: {'✅ Yes' if config.HTTPS_ONLY else '⚠️  No'}")
+    print(f"   • Environment: {config.ENVIRONMENT}")
     
     # SECURITY: Validate configuration
-    errors = Config.validate()
+    errors = config.validate()
     if errors:
         critical = [e for e in errors if 'CRITICAL' in e]
         warnings = [e for e in errors if 'WARNING' in e]
@@ -561,13 +561,13 @@ if __name__ == '__main__':
             print("\n   Consider fixing these for production use.")
     
     print("\n🌐 Starting web server...")
-    print(f"   URL: http://{'127.0.0.1' if not Config.HTTPS_ONLY else 'localhost'}:5000")
+    print(f"   URL: http://{'127.0.0.1' if not config.HTTPS_ONLY else 'localhost'}:5000")
     print("\n   Press Ctrl+C to stop\n")
     print("="*70 + "\n")
     
     # SECURITY: Run with appropriate settings
     app.run(
-        debug=Config.DEBUG,
+        debug=config.DEBUG,
         host='127.0.0.1',
         port=5000,
         threaded=True,